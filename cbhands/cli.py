@@ -1,25 +1,168 @@
 """CLI interface for cbhands."""
 
+import importlib
 import os
 import sys
-import time
-from typing import Optional
-import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata as importlib_metadata
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import click
 from colorama import init, Fore, Style
 
 from .config import Config
-from .manager import ServiceManager
 from .logger import get_logger
+from .tail import follow as follow_file
 
-# Initialize colorama for cross-platform colored output
-init()
+if TYPE_CHECKING:
+    from .manager import ServiceManager
 
 logger = get_logger(__name__)
 
+# Whether colorama has been initialized, see _ensure_colors()
+_colors_ready = False
+
+# Report separators and headers
+_SEP30 = "=" * 30
+_SEP40 = "=" * 40
+_SEP50 = "=" * 50
+_STATUS_HEADER = f"{Fore.CYAN}Battle Hands Services Status{Style.RESET_ALL}"
+_SERVICES_HEADER = f"{Fore.CYAN}Available Services:{Style.RESET_ALL}"
+_PLUGINS_HEADER = f"{Fore.CYAN}Available Plugins:{Style.RESET_ALL}"
+_DISCOVERED_HEADER = f"{Fore.CYAN}Discovered Battle Hands Processes:{Style.RESET_ALL}"
+_HEALTH_HEADER = f"{Fore.CYAN}Battle Hands Health Status{Style.RESET_ALL}"
+
+# Precomputed status badges and lines for service status output
+_STATUS_COLORS = {'running': Fore.GREEN, 'stopped': Fore.RED}
+_STATUS_BADGES = {
+    'running': f"{Fore.GREEN}●{Style.RESET_ALL}",
+    'stopped': f"{Fore.RED}○{Style.RESET_ALL}",
+}
+_UNKNOWN_BADGE = f"{Fore.YELLOW}?{Style.RESET_ALL}"
+_STOPPED_LINE = f"    Status: {Fore.RED}stopped{Style.RESET_ALL}"
+
+# Message prefix and color of service operation results
+_RESULT_SUCCESS = ("✓ ", 'green')
+_RESULT_PARTIAL = ("⚠ ", 'yellow')
+_RESULT_FAILURE = ("✗ ", 'red')
+
+# Verbose progress of the simulated 5-3-test game
+_TEST_5_3_STEPS = "\n".join([
+    "Creating test table...",
+    "Adding 5 test players...",
+    "Starting game...",
+    "Playing 3 rounds...",
+    "Game completed!",
+])
+
+
+class _KnownPlugin(NamedTuple):
+    """A plugin cbhands knows how to find and describe."""
+    name: str
+    dist_name: str
+    module_name: str
+    description: str
+    # Whether cbhands builds a command group (named after name) for it
+    command_group: bool
+
+
+_KNOWN_PLUGINS = (
+    _KnownPlugin('dev_showroom', 'cbhands-dev-showroom', 'cbhands_dev_showroom',
+                 'Development Showroom - Interactive testing and demonstration tool',
+                 command_group=True),
+    _KnownPlugin('use_games', 'cbhands-use-games', 'cbhands_use_games',
+                 'Game Testing - Testing utilities for Battle Hands',
+                 command_group=False),
+)
+
+
+class LazyGroup(click.Group):
+    """Click group that builds some subcommands only when they are requested."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, Callable[[], Optional[click.Command]]] = {}
+    
+    def add_lazy_command(self, name: str, loader: Callable[[], Optional[click.Command]]):
+        """Register a command loader that is called on first use of name."""
+        self.lazy_commands[name] = loader
+    
+    def list_commands(self, ctx) -> List[str]:
+        return sorted(set(self.commands) | set(self.lazy_commands))
+    
+    def get_command(self, ctx, cmd_name: str) -> Optional[click.Command]:
+        command = self.commands.get(cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self.lazy_commands.pop(cmd_name)()
+            if command is not None:
+                self.add_command(command, cmd_name)
+        return command
+
+
+def _report_result(success: bool, message: str, partial: bool = False,
+                   exit_on_failure: bool = True) -> bool:
+    """Print the result of a service operation.
+    
+    Args:
+        success: Whether the operation succeeded
+        message: Message returned by the operation
+        partial: Report failure as a warning (bulk operations)
+        exit_on_failure: Exit with status 1 on failure
+        
+    Returns:
+        The success flag
+    """
+    if success:
+        prefix, color = _RESULT_SUCCESS
+    elif partial:
+        prefix, color = _RESULT_PARTIAL
+    else:
+        prefix, color = _RESULT_FAILURE
+    click.secho(prefix + message, fg=color, err=not success)
+    
+    if not success and exit_on_failure:
+        sys.exit(1)
+    return success
+
+
+def _ensure_colors():
+    """Initialize colorama on first use.
+    
+    Only the plugin section of the help text needs it: that text embeds raw
+    colorama codes and is printed through sys.stdout, which init() wraps.
+    Block output from _echo_lines goes to the raw byte buffer and is not
+    affected by colorama at all.
+    """
+    global _colors_ready
+    if not _colors_ready:
+        init()
+        _colors_ready = True
+
+
+def _echo_lines(lines: List[str]):
+    """Write a block of output lines to stdout with a single write.
+    
+    The block is encoded once and written to the binary buffer, bypassing
+    the per-call text layer of click.echo. Colors are stripped when stdout
+    is not a terminal, as click.echo would do.
+    """
+    text = "\n".join(lines) + "\n"
+    stream = sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        click.echo(text, nl=False)
+        return
+    
+    if not stream.isatty():
+        text = click.unstyle(text)
+    
+    stream.flush()
+    buffer.write(text.encode(stream.encoding or 'utf-8', 'replace'))
+    buffer.flush()
+
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.option('--config', '-c', help='Path to configuration file')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
 @click.pass_context
@@ -30,25 +173,38 @@ def cli(ctx, config: Optional[str], verbose: bool):
     
     try:
         ctx.obj['config'] = Config(config)
-        ctx.obj['manager'] = ServiceManager(ctx.obj['config'])
     except Exception as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}", err=True)
+        click.secho(f"Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
+def _get_manager(ctx) -> 'ServiceManager':
+    """Get the service manager, creating it on first use.
+    
+    Commands that only read configuration never pay for ServiceManager
+    setup (psutil import, state file load, log/PID directory creation).
+    """
+    manager = ctx.obj.get('manager')
+    if manager is None:
+        from .manager import ServiceManager
+        
+        try:
+            manager = ServiceManager(ctx.obj['config'])
+            ctx.obj['manager'] = manager
+        except Exception as e:
+            click.secho(f"Error: {e}", fg='red', err=True)
+            sys.exit(1)
+    return manager
+
+
 @cli.command()
 @click.argument('service_name')
 @click.pass_context
 def start(ctx, service_name: str):
     """Start a service."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.start_service(service_name)
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message)
 
 
 @cli.command()
@@ -56,14 +212,9 @@ def start(ctx, service_name: str):
 @click.pass_context
 def stop(ctx, service_name: str):
     """Stop a service."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.stop_service(service_name)
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message)
 
 
 @cli.command()
@@ -71,42 +222,27 @@ def stop(ctx, service_name: str):
 @click.pass_context
 def restart(ctx, service_name: str):
     """Restart a service."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.restart_service(service_name)
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message)
 
 
 @cli.command()
 @click.pass_context
 def start_all(ctx):
     """Start all Battle Hands services."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.start_all_services()
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message, partial=True)
 
 
 @cli.command()
 @click.pass_context
 def stop_all(ctx):
     """Stop all Battle Hands services."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.stop_all_services()
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message, partial=True)
 
 
 @cli.command()
@@ -114,67 +250,61 @@ def stop_all(ctx):
 @click.pass_context
 def status(ctx, service_name: Optional[str]):
     """Show status of service(s)."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     
     if service_name:
         # Show status of specific service
         status_info = manager.get_service_status(service_name)
-        _print_service_status(status_info)
+        _echo_lines(_format_service_status(status_info))
     else:
         # Show status of all services
         all_status = manager.get_all_services_status()
         
-        click.echo(f"{Fore.CYAN}Battle Hands Services Status{Style.RESET_ALL}")
-        click.echo("=" * 50)
+        # Build the whole report first and emit it with a single write
+        lines = [_STATUS_HEADER, _SEP50]
         
         for status_info in all_status:
-            _print_service_status(status_info)
-            click.echo()
+            lines.extend(_format_service_status(status_info))
+            lines.append("")
+        
+        _echo_lines(lines)
 
 
-def _print_service_status(status_info: dict):
-    """Print service status information."""
+def _format_service_status(status_info: dict) -> List[str]:
+    """Format service status information as output lines."""
     name = status_info['name']
     status = status_info['status']
     pid = status_info.get('pid')
     port = status_info.get('port')
-    description = status_info.get('description', '')
+    description = status_info.get('description') or ''
+    uptime = status_info.get('uptime')
     
-    # Status color and symbol
-    if status == 'running':
-        status_color = Fore.GREEN
-        status_symbol = "●"
-    elif status == 'stopped':
-        status_color = Fore.RED
-        status_symbol = "○"
-    else:
-        status_color = Fore.YELLOW
-        status_symbol = "?"
-    
-    # Print service info
-    click.echo(f"{status_color}{status_symbol}{Style.RESET_ALL} {Fore.BLUE}{name}{Style.RESET_ALL}")
+    # Service info
+    badge = _STATUS_BADGES.get(status, _UNKNOWN_BADGE)
+    lines = [f"{badge} {Fore.BLUE}{name}{Style.RESET_ALL}"]
     
     if description:
-        click.echo(f"    {description}")
+        lines.append(f"    {description}")
     
     # Always show port if available
     if port:
-        click.echo(f"    Port: {port}")
+        lines.append(f"    Port: {port}")
     
     if status == 'running' and pid:
-        click.echo(f"    PID: {pid}")
+        lines.append(f"    PID: {pid}")
         
         # Show uptime if available
-        uptime = status_info.get('uptime')
         if uptime:
-            hours = int(uptime // 3600)
-            minutes = int((uptime % 3600) // 60)
-            seconds = int(uptime % 60)
-            click.echo(f"    Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}")
+            hours, rem = divmod(int(uptime), 3600)
+            minutes, seconds = divmod(rem, 60)
+            lines.append(f"    Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}")
     elif status == 'stopped':
-        click.echo(f"    Status: {status_color}stopped{Style.RESET_ALL}")
+        lines.append(_STOPPED_LINE)
     else:
-        click.echo(f"    Status: {status_color}{status}{Style.RESET_ALL}")
+        status_color = _STATUS_COLORS.get(status, Fore.YELLOW)
+        lines.append(f"    Status: {status_color}{status}{Style.RESET_ALL}")
+    
+    return lines
 
 
 @cli.command()
@@ -184,23 +314,19 @@ def _print_service_status(status_info: dict):
 @click.pass_context
 def logs(ctx, service_name: str, lines: int, follow: bool):
     """Show logs for a service."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     
     if follow:
         # Follow logs (tail -f behavior)
         log_file = manager._get_log_file(service_name)
         if not log_file or not os.path.exists(log_file):
-            click.echo(f"{Fore.RED}No log file found for service '{service_name}'{Style.RESET_ALL}", err=True)
+            click.secho(f"No log file found for service '{service_name}'", fg='red', err=True)
             sys.exit(1)
         
         try:
-            import subprocess
-            subprocess.run(['tail', '-f', log_file])
+            follow_file(log_file, lines)
         except KeyboardInterrupt:
-            click.echo(f"\n{Fore.YELLOW}Stopped following logs{Style.RESET_ALL}")
-        except FileNotFoundError:
-            click.echo(f"{Fore.RED}tail command not found. Please install coreutils{Style.RESET_ALL}", err=True)
-            sys.exit(1)
+            click.secho("\nStopped following logs", fg='yellow')
     else:
         # Show last N lines
         log_content = manager.get_service_logs(service_name, lines)
@@ -214,15 +340,16 @@ def list_services(ctx):
     config = ctx.obj['config']
     services = config.get_services()
     
-    click.echo(f"{Fore.CYAN}Available Services:{Style.RESET_ALL}")
-    click.echo("=" * 30)
+    lines = [_SERVICES_HEADER, _SEP30]
     
     for name, service_config in services.items():
         description = service_config.get('description', 'No description')
         port = service_config.get('port', 'N/A')
-        click.echo(f"{Fore.BLUE}{name}{Style.RESET_ALL} (port: {port})")
-        click.echo(f"    {description}")
-        click.echo()
+        lines.append(f"{Fore.BLUE}{name}{Style.RESET_ALL} (port: {port})")
+        lines.append(f"    {description}")
+        lines.append("")
+    
+    _echo_lines(lines)
 
 
 @cli.command()
@@ -230,109 +357,122 @@ def plugins():
     """List all available plugins."""
     plugin_info = get_plugin_info()
     
-    click.echo(f"{Fore.CYAN}Available Plugins:{Style.RESET_ALL}")
-    click.echo("=" * 30)
+    lines = [_PLUGINS_HEADER, _SEP30]
     
     if not plugin_info:
-        click.echo(f"{Fore.YELLOW}No plugins found{Style.RESET_ALL}")
+        lines.append(f"{Fore.YELLOW}No plugins found{Style.RESET_ALL}")
+        _echo_lines(lines)
         return
     
     for plugin in plugin_info:
-        click.echo(f"{Fore.BLUE}{plugin['name']}{Style.RESET_ALL} v{plugin['version']}")
-        click.echo(f"    {plugin['description']}")
-        click.echo()
+        lines.append(f"{Fore.BLUE}{plugin.name}{Style.RESET_ALL} v{plugin.version}")
+        lines.append(f"    {plugin.description}")
+        lines.append("")
+    
+    _echo_lines(lines)
 
 
 @cli.command()
 @click.pass_context
 def discover(ctx):
     """Discover all running Battle Hands processes."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     discovered = manager.discover_all_processes()
     
     if not discovered:
-        click.echo(f"{Fore.YELLOW}No Battle Hands processes discovered{Style.RESET_ALL}")
+        click.secho("No Battle Hands processes discovered", fg='yellow')
         return
     
-    click.echo(f"{Fore.CYAN}Discovered Battle Hands Processes:{Style.RESET_ALL}")
-    click.echo("=" * 40)
+    lines = [_DISCOVERED_HEADER, _SEP40]
     
     for service_type, proc in discovered.items():
-        status_color = Fore.GREEN if proc.pid else Fore.RED
-        click.echo(f"{Fore.BLUE}{service_type.upper()}{Style.RESET_ALL}")
-        click.echo(f"    PID: {status_color}{proc.pid}{Style.RESET_ALL}")
-        click.echo(f"    Command: {proc.command}")
-        click.echo(f"    Working Dir: {proc.working_directory}")
-        click.echo(f"    Port: {proc.port or 'N/A'}")
-        click.echo(f"    Uptime: {proc.uptime}")
-        click.echo(f"    CPU: {proc.cpu_percent:.1f}%")
-        click.echo(f"    Memory: {proc.memory_percent:.1f}%")
-        if proc.children:
-            click.echo(f"    Children: {proc.children}")
-        click.echo()
+        lines.extend(_format_discovered_process(service_type, proc))
+        lines.append("")
+    
+    _echo_lines(lines)
+
+
+def _format_discovered_process(service_type: str, proc) -> List[str]:
+    """Format discovered process information as output lines."""
+    status_color = Fore.GREEN if proc.pid else Fore.RED
+    lines = [
+        f"{Fore.BLUE}{service_type.upper()}{Style.RESET_ALL}",
+        f"    PID: {status_color}{proc.pid}{Style.RESET_ALL}",
+        f"    Command: {proc.command}",
+        f"    Working Dir: {proc.working_directory}",
+        f"    Port: {proc.port or 'N/A'}",
+        f"    Uptime: {proc.uptime}",
+        f"    CPU: {proc.cpu_percent:.1f}%",
+        f"    Memory: {proc.memory_percent:.1f}%",
+    ]
+    if proc.children:
+        lines.append(f"    Children: {proc.children}")
+    return lines
 
 
 @cli.command()
 @click.pass_context
 def health(ctx):
     """Get comprehensive health status of all services."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     status = manager.get_comprehensive_status()
     
-    click.echo(f"{Fore.CYAN}Battle Hands Health Status{Style.RESET_ALL}")
-    click.echo("=" * 30)
-    click.echo(f"Total Services: {status['total_services']}")
-    click.echo(f"Running: {Fore.GREEN}{status['running_services']}{Style.RESET_ALL}")
-    click.echo(f"Stopped: {Fore.RED}{status['stopped_services']}{Style.RESET_ALL}")
-    click.echo()
+    lines = [
+        _HEALTH_HEADER,
+        _SEP30,
+        f"Total Services: {status['total_services']}",
+        f"Running: {Fore.GREEN}{status['running_services']}{Style.RESET_ALL}",
+        f"Stopped: {Fore.RED}{status['stopped_services']}{Style.RESET_ALL}",
+        "",
+    ]
     
     for service_name, service_info in status['services'].items():
-        status_color = Fore.GREEN if service_info['status'] == 'running' else Fore.RED
-        managed_color = Fore.BLUE if service_info['managed_by'] == 'cbhands' else Fore.YELLOW
-        
-        click.echo(f"{Fore.BLUE}{service_name.upper()}{Style.RESET_ALL}")
-        click.echo(f"    Status: {status_color}{service_info['status'].upper()}{Style.RESET_ALL}")
-        click.echo(f"    Managed by: {managed_color}{service_info['managed_by']}{Style.RESET_ALL}")
-        click.echo(f"    PID: {service_info.get('pid', 'N/A')}")
-        click.echo(f"    Port: {service_info.get('port', 'N/A')}")
-        click.echo(f"    Uptime: {service_info.get('uptime', 'N/A')}")
-        
-        if 'cpu_percent' in service_info:
-            click.echo(f"    CPU: {service_info['cpu_percent']:.1f}%")
-        if 'memory_percent' in service_info:
-            click.echo(f"    Memory: {service_info['memory_percent']:.1f}%")
-        if 'command' in service_info:
-            click.echo(f"    Command: {service_info['command']}")
-        
-        click.echo()
+        lines.extend(_format_service_health(service_name, service_info))
+        lines.append("")
+    
+    _echo_lines(lines)
+
+
+def _format_service_health(service_name: str, service_info: dict) -> List[str]:
+    """Format service health information as output lines."""
+    status_color = Fore.GREEN if service_info['status'] == 'running' else Fore.RED
+    managed_color = Fore.BLUE if service_info['managed_by'] == 'cbhands' else Fore.YELLOW
+    
+    lines = [
+        f"{Fore.BLUE}{service_name.upper()}{Style.RESET_ALL}",
+        f"    Status: {status_color}{service_info['status'].upper()}{Style.RESET_ALL}",
+        f"    Managed by: {managed_color}{service_info['managed_by']}{Style.RESET_ALL}",
+        f"    PID: {service_info.get('pid', 'N/A')}",
+        f"    Port: {service_info.get('port', 'N/A')}",
+        f"    Uptime: {service_info.get('uptime', 'N/A')}",
+    ]
+    
+    if 'cpu_percent' in service_info:
+        lines.append(f"    CPU: {service_info['cpu_percent']:.1f}%")
+    if 'memory_percent' in service_info:
+        lines.append(f"    Memory: {service_info['memory_percent']:.1f}%")
+    if 'command' in service_info:
+        lines.append(f"    Command: {service_info['command']}")
+    
+    return lines
 
 
 @cli.command()
 @click.pass_context
 def cleanup(ctx):
     """Clean up orphaned Battle Hands processes."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.cleanup_orphaned_processes()
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message)
 
 
 @cli.command()
 @click.pass_context
 def restart_all(ctx):
     """Restart all Battle Hands services."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     success, message = manager.restart_all_services()
-    
-    if success:
-        click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
-        sys.exit(1)
+    _report_result(success, message)
 
 
 @cli.group()
@@ -347,44 +487,40 @@ def use_games():
 @click.pass_context
 def test(ctx, test: str, verbose: bool):
     """Run game tests."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     config = ctx.obj['config']
     
     if verbose:
-        click.echo(f"{Fore.CYAN}Running test: {test}{Style.RESET_ALL}")
+        click.secho(f"Running test: {test}", fg='cyan')
     
     # Start required services
     required_services = ['lobby', 'dealer']
+    started_services = []
     
     for service_name in required_services:
         if not manager._is_service_running(service_name):
-            click.echo(f"{Fore.YELLOW}Starting {service_name}...{Style.RESET_ALL}")
+            click.secho(f"Starting {service_name}...", fg='yellow')
             success, message = manager.start_service(service_name)
-            if success:
-                click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-            else:
-                click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
+            if not _report_result(success, message, exit_on_failure=False):
                 return
+            started_services.append(service_name)
     
-    # Wait for services to be ready
-    import time
-    time.sleep(3)
+    # Wait for started services to accept connections
+    for service_name in started_services:
+        if not manager.wait_for_service(service_name, timeout=3.0):
+            click.secho(f"⚠ {service_name} is not accepting connections yet", fg='yellow', err=True)
     
     # Run test
     if test == "5-3-test":
-        click.echo(f"{Fore.CYAN}Running 5-3-test: 5 players, 3 rounds{Style.RESET_ALL}")
+        click.secho("Running 5-3-test: 5 players, 3 rounds", fg='cyan')
         
         # Simulate test game
         if verbose:
-            click.echo("Creating test table...")
-            click.echo("Adding 5 test players...")
-            click.echo("Starting game...")
-            click.echo("Playing 3 rounds...")
-            click.echo("Game completed!")
+            click.echo(_TEST_5_3_STEPS)
         
-        click.echo(f"{Fore.GREEN}✓ Test '{test}' completed successfully{Style.RESET_ALL}")
+        click.secho(f"✓ Test '{test}' completed successfully", fg='green')
     else:
-        click.echo(f"{Fore.RED}Unknown test: {test}{Style.RESET_ALL}", err=True)
+        click.secho(f"Unknown test: {test}", fg='red', err=True)
 
 
 @cli.group()
@@ -397,162 +533,205 @@ def monitor():
 @click.pass_context
 def watch(ctx):
     """Watch real-time monitoring."""
-    manager = ctx.obj['manager']
+    manager = _get_manager(ctx)
     
     # Start monitor service if not running
     if not manager._is_service_running('cbhands_monitor_ts'):
-        click.echo(f"{Fore.YELLOW}Starting monitor service...{Style.RESET_ALL}")
+        click.secho("Starting monitor service...", fg='yellow')
         success, message = manager.start_service('cbhands_monitor_ts')
-        if success:
-            click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
-        else:
-            click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}", err=True)
+        if not _report_result(success, message, exit_on_failure=False):
             return
     
-    click.echo(f"{Fore.CYAN}Monitor is running at http://localhost:9000{Style.RESET_ALL}")
-    click.echo(f"{Fore.YELLOW}Press Ctrl+C to stop watching{Style.RESET_ALL}")
+    click.echo(click.style("Monitor is running at http://localhost:9000", fg='cyan') + "\n"
+               + click.style("Press Ctrl+C to stop watching", fg='yellow'))
     
     try:
         # Follow monitor logs
         log_file = manager._get_log_file('cbhands_monitor_ts')
         if os.path.exists(log_file):
-            import subprocess
-            subprocess.run(['tail', '-f', log_file])
+            follow_file(log_file)
         else:
-            click.echo(f"{Fore.RED}Monitor log file not found{Style.RESET_ALL}", err=True)
+            click.secho("Monitor log file not found", fg='red', err=True)
     except KeyboardInterrupt:
-        click.echo(f"\n{Fore.YELLOW}Stopped watching monitor{Style.RESET_ALL}")
+        click.secho("\nStopped watching monitor", fg='yellow')
 
 
+@lru_cache(maxsize=1)
 def load_plugins():
-    """Load available plugins."""
+    """Load available plugins (once per process).
+    
+    Plugins are keyed by their _KNOWN_PLUGINS name, not by the name the
+    plugin class reports, so command group names do not depend on it.
+    """
     plugins = {}
     
     try:
         # Try to load simple dev_showroom plugin first
         from cbhands_dev_showroom.simple_plugin import SimpleDevShowroomPlugin
         dev_showroom = SimpleDevShowroomPlugin()
-        plugins[dev_showroom.name] = dev_showroom
+        plugins['dev_showroom'] = dev_showroom
     except ImportError as e:
-        print(f"Debug: Could not import simple dev_showroom: {e}")
+        logger.debug("Could not import simple dev_showroom: %s", e)
         try:
             # Fallback to full plugin
             from cbhands_dev_showroom.plugin import DevShowroomPlugin
             dev_showroom = DevShowroomPlugin()
-            plugins[dev_showroom.name] = dev_showroom
+            plugins['dev_showroom'] = dev_showroom
         except ImportError as e2:
-            print(f"Debug: Could not import full dev_showroom: {e2}")
+            logger.debug("Could not import full dev_showroom: %s", e2)
             pass
     
     return plugins
 
 
-def get_plugin_info():
-    """Get plugin information including versions."""
-    plugin_info = []
+@dataclass(frozen=True)
+class PluginMetadata:
+    """Metadata of an installed plugin."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('name', 'version', 'description')
+    name: str
+    version: str
+    description: str
+    
+    # Frozen instances cannot restore slots through setattr, so copy and
+    # pickle need explicit state handling (as slots=True would generate)
+    def __getstate__(self):
+        return (self.name, self.version, self.description)
     
+    def __setstate__(self, state):
+        for field_name, value in zip(self.__slots__, state):
+            object.__setattr__(self, field_name, value)
+
+
+def _get_plugin_version(dist_name: str, module_name: str) -> Optional[str]:
+    """Get version of an installed plugin.
+    
+    The installed distribution metadata is consulted first so the plugin
+    package does not have to be imported; importing it is only a fallback
+    for plugins available on the path without metadata.
+    
+    Args:
+        dist_name: Distribution name of the plugin
+        module_name: Top-level import name of the plugin
+        
+    Returns:
+        Plugin version, or None if the plugin is not installed
+    """
     try:
-        # Get dev_showroom plugin info
-        import cbhands_dev_showroom
-        plugin_info.append({
-            'name': 'dev_showroom',
-            'version': getattr(cbhands_dev_showroom, '__version__', '0.1.0'),
-            'description': 'Development Showroom - Interactive testing and demonstration tool'
-        })
-    except ImportError:
+        return importlib_metadata.version(dist_name)
+    except importlib_metadata.PackageNotFoundError:
         pass
     
     try:
-        # Get use_games plugin info
-        import cbhands_use_games
-        plugin_info.append({
-            'name': 'use_games',
-            'version': getattr(cbhands_use_games, '__version__', '0.1.0'),
-            'description': 'Game Testing - Testing utilities for Battle Hands'
-        })
+        module = importlib.import_module(module_name)
     except ImportError:
-        pass
+        return None
+    return getattr(module, '__version__', '0.1.0')
+
+
+@lru_cache(maxsize=1)
+def get_plugin_info() -> Tuple[PluginMetadata, ...]:
+    """Get plugin information including versions (once per process)."""
+    plugin_info = []
     
-    return plugin_info
+    for known in _KNOWN_PLUGINS:
+        version = _get_plugin_version(known.dist_name, known.module_name)
+        if version is not None:
+            plugin_info.append(PluginMetadata(
+                name=known.name,
+                version=version,
+                description=known.description
+            ))
+    
+    return tuple(plugin_info)
+
+
+# Plugin commands the CLI knows how to expose, with their options as
+# (param_decls, click.Option keyword arguments)
+_PLUGIN_COMMAND_OPTIONS = {
+    'create-tables': (
+        (('--count',), {'default': 10, 'help': 'Number of tables to create'}),
+        (('--mode',), {'default': 'fun', 'help': 'Game mode'}),
+    ),
+    'list-tables': (),
+    'show-table': (
+        (('--name',), {'required': True, 'help': 'Table name'}),
+    ),
+    'delete-tables': (
+        (('--all', 'all_tables'), {'is_flag': True, 'help': 'All tables'}),
+        (('--name',), {'help': 'Table name'}),
+    ),
+    'show-redis': (
+        (('--keys',), {'help': 'Redis key pattern'}),
+    ),
+    'interactive': (),
+}
+
+
+def _build_plugin_command(command_name: str, handler: Callable) -> click.Command:
+    """Build a click command that passes its options to a plugin handler."""
+    @click.pass_context
+    def callback(ctx, **kwargs):
+        handler(verbose=ctx.obj.get('verbose', False), **kwargs)
+    
+    params = [click.Option(list(decls), **attrs)
+              for decls, attrs in _PLUGIN_COMMAND_OPTIONS[command_name]]
+    return click.Command(command_name, callback=callback, params=params)
+
+
+def _create_plugin_group(plugin_name: str, plugin) -> Optional[click.Group]:
+    """Create a command group for a plugin.
+    
+    Subcommands are registered by name and only built when invoked.
+    Returns None if the plugin provides none of the supported commands.
+    """
+    commands = plugin.get_commands()
+    supported = [name for name in _PLUGIN_COMMAND_OPTIONS if name in commands]
+    if not supported:
+        return None
+    
+    # Create a plugin group with hyphenated name
+    plugin_group = LazyGroup(name=plugin_name.replace('_', '-'), help='Plugin commands.')
+    
+    for command_name in supported:
+        plugin_group.add_lazy_command(
+            command_name,
+            lambda name=command_name, handler=commands[command_name]: _build_plugin_command(name, handler))
+    
+    return plugin_group
+
+
+def _load_plugin_group(plugin_name: str) -> Optional[click.Group]:
+    """Import plugins and build the command group of plugin_name."""
+    plugin = load_plugins().get(plugin_name)
+    if plugin is None:
+        return None
+    return _create_plugin_group(plugin_name, plugin)
+
+
+def _help_requested() -> bool:
+    """Check whether this invocation will print the main help text."""
+    args = sys.argv[1:]
+    return not args or '--help' in args
 
 
 def main():
     """Main entry point."""
-    # Load plugins
-    plugins = load_plugins()
-    
-    # Add plugin commands to CLI
-    for plugin_name, plugin in plugins.items():
-        commands = plugin.get_commands()
-        
-        # Create a plugin group with hyphenated name
-        plugin_group_name = plugin_name.replace('_', '-')
-        
-        @click.group(name=plugin_group_name)
-        def plugin_group():
-            """Plugin commands."""
-            pass
-        
-        # Create commands for each plugin function
-        if 'create-tables' in commands:
-            @click.command(name='create-tables')
-            @click.option('--count', default=10, help='Number of tables to create')
-            @click.option('--mode', default='fun', help='Game mode')
-            @click.pass_context
-            def create_tables_command(ctx, count, mode, **kwargs):
-                commands['create-tables'](count=count, mode=mode, verbose=ctx.obj.get('verbose', False))
-            plugin_group.add_command(create_tables_command)
-        
-        if 'list-tables' in commands:
-            @click.command(name='list-tables')
-            @click.pass_context
-            def list_tables_command(ctx, **kwargs):
-                commands['list-tables'](verbose=ctx.obj.get('verbose', False))
-            plugin_group.add_command(list_tables_command)
-        
-        if 'show-table' in commands:
-            @click.command(name='show-table')
-            @click.option('--name', required=True, help='Table name')
-            @click.pass_context
-            def show_table_command(ctx, name, **kwargs):
-                commands['show-table'](name=name, verbose=ctx.obj.get('verbose', False))
-            plugin_group.add_command(show_table_command)
-        
-        if 'delete-tables' in commands:
-            @click.command(name='delete-tables')
-            @click.option('--all', is_flag=True, help='All tables')
-            @click.option('--name', help='Table name')
-            @click.pass_context
-            def delete_tables_command(ctx, all, name, **kwargs):
-                commands['delete-tables'](all_tables=all, name=name, verbose=ctx.obj.get('verbose', False))
-            plugin_group.add_command(delete_tables_command)
-        
-        if 'show-redis' in commands:
-            @click.command(name='show-redis')
-            @click.option('--keys', help='Redis key pattern')
-            @click.pass_context
-            def show_redis_command(ctx, keys, **kwargs):
-                commands['show-redis'](keys=keys, verbose=ctx.obj.get('verbose', False))
-            plugin_group.add_command(show_redis_command)
-        
-        if 'interactive' in commands:
-            @click.command(name='interactive')
-            @click.pass_context
-            def interactive_command(ctx, **kwargs):
-                commands['interactive'](verbose=ctx.obj.get('verbose', False))
-            plugin_group.add_command(interactive_command)
-        
-        # Add the plugin group to the main CLI
-        cli.add_command(plugin_group)
-    
-    # Add plugin information to help
-    plugin_info = get_plugin_info()
+    # Register plugin groups by name only; plugins are imported on first use
+    for known in _KNOWN_PLUGINS:
+        if known.command_group:
+            cli.add_lazy_command(known.name.replace('_', '-'),
+                                 lambda name=known.name: _load_plugin_group(name))
+    
+    # Add plugin information to help, only when help is going to be shown
+    plugin_info = get_plugin_info() if _help_requested() else None
     if plugin_info:
+        _ensure_colors()
+        
         # Create enhanced help text
-        plugin_text = f"\n\n{Fore.CYAN}Available Plugins:{Style.RESET_ALL}\n"
-        plugin_text += "=" * 30 + "\n"
+        plugin_text = f"\n\n{_PLUGINS_HEADER}\n{_SEP30}\n"
         for plugin in plugin_info:
-            plugin_text += f"{Fore.BLUE}{plugin['name']}{Style.RESET_ALL} v{plugin['version']} - {plugin['description']}\n"
+            plugin_text += f"{Fore.BLUE}{plugin.name}{Style.RESET_ALL} v{plugin.version} - {plugin.description}\n"
         plugin_text += "\n"
         
         # Append plugin information to help
@@ -1,11 +1,40 @@
 """Configuration management for cbhands."""
 
+import copy
 import os
-import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 
+def yaml_loader():
+    """Get the fastest available safe YAML loader.
+    
+    PyYAML is imported on first use; the libyaml-backed loader is preferred.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def yaml_dumper():
+    """Get the fastest available safe YAML dumper.
+    
+    PyYAML is imported on first use; the libyaml-backed dumper is preferred.
+    """
+    try:
+        from yaml import CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeDumper as dumper
+    return dumper
+
+
+# Parsed configuration files keyed by (path, mtime_ns, size); entries are
+# never handed out directly, callers get their own copy
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
 class Config:
     """Configuration manager for cbhands."""
     
@@ -24,42 +53,72 @@ class Config:
             ]
             
             for path in possible_paths:
-                if os.path.exists(path):
-                    config_path = path
-                    break
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                config_path = path
+                break
             else:
                 raise FileNotFoundError("No configuration file found")
+        else:
+            st = None
         
         self.config_path = config_path
-        self._config = self._load_config()
+        self._config = self._load_config(st=st)
+        self._index_config()
     
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+    def _load_config(self, use_cache: bool = True,
+                     st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Load configuration from YAML file.
+        
+        Args:
+            use_cache: Reuse a previously parsed result if the file is unchanged
+            st: Stat result of the configuration file if already known
+        """
+        if st is None:
+            st = os.stat(self.config_path)
+        key = (self.config_path, st.st_mtime_ns, st.st_size)
+        if use_cache and key in _CONFIG_CACHE:
+            return copy.deepcopy(_CONFIG_CACHE[key])
+        
+        import yaml
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=yaml_loader())
         except Exception as e:
             raise RuntimeError(f"Failed to load configuration from {self.config_path}: {e}")
+        
+        _CONFIG_CACHE[key] = config
+        return copy.deepcopy(config)
+    
+    def _index_config(self):
+        """Resolve top-level sections once so lookups avoid repeated walks."""
+        # An empty file parses to None
+        self._config = self._config or {}
+        self._services = self._config.get('services', {})
+        self._settings = self._config.get('settings', {})
     
     def get_services(self) -> Dict[str, Dict[str, Any]]:
         """Get all services configuration."""
-        return self._config.get('services', {})
+        return self._services
     
     def get_service(self, service_name: str) -> Optional[Dict[str, Any]]:
         """Get specific service configuration."""
-        return self.get_services().get(service_name)
+        return self._services.get(service_name)
     
     def get_settings(self) -> Dict[str, Any]:
         """Get global settings."""
-        return self._config.get('settings', {})
+        return self._settings
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get specific setting value."""
-        return self.get_settings().get(key, default)
+        return self._settings.get(key, default)
     
     def reload(self):
         """Reload configuration from file."""
-        self._config = self._load_config()
+        self._config = self._load_config(use_cache=False)
+        self._index_config()
     
     def get_state_file_path(self) -> str:
         """Get path to state file."""
@@ -2,7 +2,18 @@
 
 import logging
 import sys
-from typing import Optional
+import threading
+from typing import Optional, Set
+
+# Formatter shared by all cbhands console handlers
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Names of loggers already set up, guarded by _lock
+_configured: Set[str] = set()
+_lock = threading.Lock()
 
 
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -11,26 +22,27 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     Args:
         name: Logger name
         level: Logging level
-        
+    
     Returns:
         Logger instance
     """
     logger = logging.getLogger(name)
+    if name in _configured:
+        return logger
     
-    if not logger.handlers:
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(level)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        logger.addHandler(handler)
-        logger.setLevel(level)
+    with _lock:
+        # Another thread may have configured it while we waited
+        if name not in _configured:
+            if not logger.handlers:
+                # Create console handler
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setLevel(level)
+                handler.setFormatter(_FORMATTER)
+                
+                # Add handler to logger
+                logger.addHandler(handler)
+                logger.setLevel(level)
+            
+            _configured.add(name)
     
     return logger
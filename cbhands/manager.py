@@ -1,20 +1,54 @@
 """Service manager for cbhands."""
 
+import json
 import os
 import time
 import signal
 import subprocess
 import psutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
-import yaml
 
-from .config import Config
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .config import Config, yaml_loader
+from . import procfs
 from .logger import get_logger
 from .process_discovery import ProcessDiscovery, DiscoveredProcess
+from .tail import read_last_lines
 
 logger = get_logger(__name__)
 
+# How long a service probe result is reused, in seconds
+_PROBE_TTL = 0.5
+
+
+def _dumps_state(state: Dict[str, Any]) -> bytes:
+    """Serialize service state as JSON, using orjson when available.
+    
+    Values JSON has no type for (such as dates parsed from the service
+    config) and non-string mapping keys are written as strings, the same
+    way by both backends.
+    """
+    if orjson is not None:
+        return orjson.dumps(state, default=str,
+                            option=(orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE |
+                                    orjson.OPT_NON_STR_KEYS |
+                                    orjson.OPT_PASSTHROUGH_DATETIME))
+    return (json.dumps(state, indent=2, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+
+
+def _loads_state(data: bytes) -> Any:
+    """Parse service state JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ServiceManager:
     """Manager for Battle Hands services."""
@@ -39,73 +73,174 @@ class ServiceManager:
         
         # Load current state
         self.state = self._load_state()
+        
+        # State writes are deferred while a batch is open
+        self._batch_depth = 0
+        self._state_dirty = False
+        
+        # Recent probe results: service name -> (probed_at, running, pid)
+        self._probe_cache: Dict[str, Tuple[float, bool, Optional[int]]] = {}
+        
+        # PID and log file paths: service name -> (pid_file, log_file)
+        self._paths: Dict[str, Tuple[str, str]] = {}
+        for service_name in config.get_services():
+            self._service_paths(service_name)
     
     def _load_state(self) -> Dict[str, Any]:
         """Load current state from state file."""
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
+                with open(self.state_file, 'rb') as f:
+                    data = f.read()
+                try:
+                    return _loads_state(data) or {}
+                except ValueError:
+                    # State written as YAML by earlier versions
+                    import yaml
+                    return yaml.load(data, Loader=yaml_loader()) or {}
             except Exception as e:
                 logger.warning(f"Failed to load state file: {e}")
         return {}
     
     def _save_state(self):
         """Save current state to state file."""
+        if self._batch_depth:
+            self._state_dirty = True
+            return
+        
+        # Write a temporary file and swap it in, so readers never see a
+        # partially written state file
+        tmp_file = f"{self.state_file}.tmp.{os.getpid()}"
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.state, f, default_flow_style=False)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps_state(self.state))
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             logger.error(f"Failed to save state file: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    
+    @contextmanager
+    def _batch_state(self):
+        """Defer state file writes until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._state_dirty:
+                self._state_dirty = False
+                self._save_state()
+    
+    def _service_paths(self, service_name: str) -> Tuple[str, str]:
+        """Get (pid_file, log_file) paths for service, building them once."""
+        paths = self._paths.get(service_name)
+        if paths is None:
+            paths = self._paths[service_name] = (
+                os.path.join(self.pid_dir, f"{service_name}.pid"),
+                os.path.join(self.log_dir, f"{service_name}.log"),
+            )
+        return paths
     
     def _get_pid_file(self, service_name: str) -> str:
         """Get PID file path for service."""
-        return os.path.join(self.pid_dir, f"{service_name}.pid")
+        return self._service_paths(service_name)[0]
     
     def _get_log_file(self, service_name: str) -> str:
         """Get log file path for service."""
-        return os.path.join(self.log_dir, f"{service_name}.log")
+        return self._service_paths(service_name)[1]
+    
+    def _probe_service(self, service_name: str,
+                       service_config: Optional[Dict[str, Any]] = None) -> Tuple[bool, Optional[int]]:
+        """Check if service is running and find its PID.
+        
+        Results are reused for _PROBE_TTL seconds so that one status sweep
+        does not repeat port, PID file and process lookups.
+        
+        Args:
+            service_name: Name of service
+            service_config: Service configuration if the caller already has it
+            
+        Returns:
+            Tuple of (running, pid)
+        """
+        now = time.monotonic()
+        cached = self._probe_cache.get(service_name)
+        if cached is not None and now - cached[0] < _PROBE_TTL:
+            return cached[1], cached[2]
+        
+        if service_config is None:
+            service_config = self.config.get_service(service_name)
+        if service_config:
+            running, pid = self._check_service_running(service_name, service_config)
+            if running and pid is None:
+                pid = self._find_service_pid(service_name, service_config)
+        else:
+            running, pid = False, None
+        self._probe_cache[service_name] = (now, running, pid)
+        return running, pid
+    
+    def _invalidate_probe(self, service_name: Optional[str] = None):
+        """Forget cached probe results for a service, or for all services."""
+        if service_name is None:
+            self._probe_cache.clear()
+        else:
+            self._probe_cache.pop(service_name, None)
     
     def _is_service_running(self, service_name: str) -> bool:
         """Check if service is running."""
-        service_config = self.config.get_service(service_name)
-        if not service_config:
-            return False
+        return self._probe_service(service_name)[0]
+    
+    def _check_service_running(self, service_name: str,
+                               service_config: Dict[str, Any]) -> Tuple[bool, Optional[int]]:
+        """Check if service is running, bypassing the probe cache.
         
+        Returns:
+            Tuple of (running, pid); pid is set only when the PID file was
+            read and verified, otherwise it still has to be looked up
+        """
         # First check: Look for processes using the expected port
         port = service_config.get('port')
         if port and self._is_port_in_use(port):
-            return True
+            return True, None
         
         # Second check: Check PID file and process
         pid_file = self._get_pid_file(service_name)
         if not os.path.exists(pid_file):
-            return False
+            return False, None
         
         try:
             with open(pid_file, 'r') as f:
                 pid = int(f.read().strip())
             
             # Check if process is still running
-            if psutil.pid_exists(pid):
-                process = psutil.Process(pid)
+            raw = procfs.read_cmdline(pid) if procfs.pid_alive(pid) else None
+            if raw is not None:
                 # Check if it's still the same command
-                cmd = ' '.join(process.cmdline())
+                if service_config['name'].encode() in raw:
+                    return True, pid
+                cmd = raw.replace(b'\0', b' ')
                 expected_cmd = service_config.get('command', '')
-                if (service_config['name'] in cmd or 
-                    expected_cmd in cmd or 
-                    cmd.endswith(expected_cmd.split()[-1])):
-                    return True
+                if (expected_cmd.encode() in cmd or 
+                    cmd.endswith(expected_cmd.split()[-1].encode())):
+                    return True, pid
             
             # Third check: Look for child processes that might be running the service
-            return self._check_child_processes(service_name, port)
+            return self._check_child_processes(service_name, port), None
             
-        except (ValueError, psutil.NoSuchProcess, psutil.AccessDenied):
+        except ValueError:
             # If PID file exists but process is dead, check for child processes
-            return self._check_child_processes(service_name, port)
+            return self._check_child_processes(service_name, port), None
     
     def _is_port_in_use(self, port: int) -> bool:
         """Check if a port is in use."""
+        # Look for a listener in the kernel socket tables before connecting
+        inodes = procfs.listening_inodes(port)
+        if inodes is not None:
+            return bool(inodes)
+        
         import socket
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -115,86 +250,90 @@ class ServiceManager:
         except:
             return False
     
+    def wait_for_service(self, service_name: str, timeout: float = 3.0,
+                         interval: float = 0.05) -> bool:
+        """Wait until a service accepts connections on its port.
+        
+        Args:
+            service_name: Name of service to wait for
+            timeout: Maximum time to wait in seconds
+            interval: Delay between connection attempts in seconds
+            
+        Returns:
+            True if the service became ready within timeout
+        """
+        service_config = self.config.get_service(service_name)
+        port = service_config.get('port') if service_config else None
+        if not port:
+            return False
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._is_port_in_use(port):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+    
     def _check_child_processes(self, service_name: str, port: int) -> bool:
         """Check for child processes that might be running the service."""
         if not port:
             return False
         
-        try:
-            # Check if port is in use by any process
-            if self._is_port_in_use(port):
-                # Find which process is using the port
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                    try:
-                        if proc.info['cmdline']:
-                            cmdline = ' '.join(proc.info['cmdline'])
-                            # Check if this looks like our service
-                            if (service_name in cmdline or 
-                                'serve' in cmdline or 
-                                'node' in cmdline and str(port) in cmdline):
-                                return True
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-        except:
-            pass
+        # Find which process is listening on the port
+        inodes = procfs.listening_inodes(port)
+        if not inodes:
+            return False
+        
+        pid = procfs.find_socket_owner(inodes)
+        if pid is None:
+            # Listener owned by a process we cannot inspect, so it cannot
+            # be attributed to this service
+            return False
         
-        return False
+        raw = procfs.read_cmdline(pid)
+        if raw is None:
+            return False
+        
+        # Check if this looks like our service
+        return (service_name.encode() in raw or 
+                b'serve' in raw or 
+                b'node' in raw and str(port).encode() in raw)
     
     def _get_service_pid(self, service_name: str) -> Optional[int]:
         """Get PID of running service."""
         if not self._is_service_running(service_name):
             return None
-        
-        service_config = self.config.get_service(service_name)
-        if not service_config:
-            return None
-        
+        return self._probe_service(service_name)[1]
+    
+    def _find_service_pid(self, service_name: str, service_config: Dict[str, Any]) -> Optional[int]:
+        """Find PID of a service known to be running."""
         port = service_config.get('port')
         
         # First try to get PID from file
         try:
             with open(self._get_pid_file(service_name), 'r') as f:
                 pid = int(f.read().strip())
-                if psutil.pid_exists(pid):
+                if procfs.pid_alive(pid):
                     return pid
         except (ValueError, FileNotFoundError):
             pass
         
         # If PID file is outdated, find the actual running process by port
         if port:
-            try:
-                # Use netstat to find the process listening on the port
-                import subprocess
-                result = subprocess.run(['netstat', '-tlnp'], capture_output=True, text=True)
-                for line in result.stdout.split('\n'):
-                    if f':{port}' in line and 'LISTEN' in line:
-                        # Extract PID from the line
-                        parts = line.split()
-                        if len(parts) >= 7:
-                            pid_part = parts[6].split('/')[0]
-                            try:
-                                pid = int(pid_part)
-                                return pid
-                            except ValueError:
-                                continue
-            except:
-                pass
+            # Find the process listening on the port via /proc
+            pid = procfs.pid_listening_on_port(port)
+            if pid is not None:
+                return pid
             
             # Fallback: search through processes
-            try:
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                    try:
-                        if proc.info['cmdline']:
-                            cmdline = ' '.join(proc.info['cmdline'])
-                            if (service_name in cmdline or 
-                                ('serve' in cmdline and '3000' in cmdline) or
-                                ('node' in cmdline and 'dist/index.js' in cmdline) or
-                                ('main' in cmdline and ('lobby' in cmdline or 'dealer' in cmdline))):
-                                return proc.info['pid']
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                        continue
-            except:
-                pass
+            name = service_name.encode()
+            for pid, raw in procfs.iter_cmdlines():
+                if (name in raw or 
+                    (b'serve' in raw and b'3000' in raw) or
+                    (b'node' in raw and b'dist/index.js' in raw) or
+                    (b'main' in raw and (b'lobby' in raw or b'dealer' in raw))):
+                    return pid
         
         return None
     
@@ -236,15 +375,21 @@ class ServiceManager:
                 # Split command for direct execution
                 cmd = service_config['command'].split()
             
-            # Start process
-            process = subprocess.Popen(
-                cmd,
-                cwd=service_config['working_directory'],
-                stdout=open(self._get_log_file(service_name), 'a'),
-                stderr=subprocess.STDOUT,
-                env={**os.environ, **{k: str(v) for k, v in service_config.get('env', {}).items()}},
-                preexec_fn=os.setsid if '&&' in service_config['command'] or '|' in service_config['command'] else None
-            )
+            # Start process; the child gets its own copy of the log descriptor
+            log_fd = os.open(self._get_log_file(service_name),
+                             os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=service_config['working_directory'],
+                    stdout=log_fd,
+                    stderr=subprocess.STDOUT,
+                    env={**os.environ, **{k: str(v) for k, v in service_config.get('env', {}).items()}},
+                    preexec_fn=os.setsid if '&&' in service_config['command'] or '|' in service_config['command'] else None
+                )
+            finally:
+                os.close(log_fd)
+            self._invalidate_probe(service_name)
             
             # Save PID
             with open(self._get_pid_file(service_name), 'w') as f:
@@ -294,6 +439,7 @@ class ServiceManager:
                 # Force kill if graceful shutdown failed
                 process.kill()
                 process.wait(timeout=2)
+            self._invalidate_probe(service_name)
             
             # Special handling for lobby service - clear Redis guard key
             if service_name == 'lobby':
@@ -315,6 +461,7 @@ class ServiceManager:
             
         except psutil.NoSuchProcess:
             # Process already dead
+            self._invalidate_probe(service_name)
             pid_file = self._get_pid_file(service_name)
             if os.path.exists(pid_file):
                 os.remove(pid_file)
@@ -364,8 +511,7 @@ class ServiceManager:
                 'message': 'Service not found in configuration'
             }
         
-        is_running = self._is_service_running(service_name)
-        pid = self._get_service_pid(service_name)
+        is_running, pid = self._probe_service(service_name, service_config)
         
         status_info = {
             'name': service_name,
@@ -391,7 +537,14 @@ class ServiceManager:
             List of service status information
         """
         services = self.config.get_services()
-        return [self.get_service_status(name) for name in services.keys()]
+        self._invalidate_probe()
+        if len(services) < 2:
+            return [self.get_service_status(name) for name in services.keys()]
+        
+        # Probes mostly wait on the kernel, so services are checked in parallel;
+        # each worker touches a different probe cache entry
+        with ThreadPoolExecutor(max_workers=min(32, len(services))) as executor:
+            return list(executor.map(self.get_service_status, services.keys()))
     
     def get_service_logs(self, service_name: str, lines: int = 100) -> str:
         """Get logs for a service.
@@ -408,9 +561,9 @@ class ServiceManager:
             return f"No log file found for service '{service_name}'"
         
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                return ''.join(all_lines[-lines:])
+            # Read only the tail instead of the whole log
+            with open(log_file, 'rb') as f:
+                return read_last_lines(f, lines).decode('utf-8', errors='replace')
         except Exception as e:
             return f"Error reading logs for service '{service_name}': {e}"
     
@@ -424,12 +577,13 @@ class ServiceManager:
         stopped_services = []
         failed_services = []
         
-        for service_name in services.keys():
-            success, message = self.stop_service(service_name)
-            if success:
-                stopped_services.append(service_name)
-            else:
-                failed_services.append(service_name)
+        with self._batch_state():
+            for service_name in services.keys():
+                success, message = self.stop_service(service_name)
+                if success:
+                    stopped_services.append(service_name)
+                else:
+                    failed_services.append(service_name)
         
         if not failed_services:
             return True, f"All services stopped successfully: {', '.join(stopped_services)}"
@@ -448,12 +602,13 @@ class ServiceManager:
         started_services = []
         failed_services = []
         
-        for service_name in services.keys():
-            success, message = self.start_service(service_name)
-            if success:
-                started_services.append(service_name)
-            else:
-                failed_services.append(service_name)
+        with self._batch_state():
+            for service_name in services.keys():
+                success, message = self.start_service(service_name)
+                if success:
+                    started_services.append(service_name)
+                else:
+                    failed_services.append(service_name)
         
         if not failed_services:
             return True, f"All services started successfully: {', '.join(started_services)}"
@@ -479,17 +634,17 @@ class ServiceManager:
         # Get configured services status
         configured_services = {}
         services = self.config.get_services()
+        self._invalidate_probe()
         
-        for service_name in services.keys():
-            is_running = self._is_service_running(service_name)
-            pid = self._get_service_pid(service_name) if is_running else None
+        for service_name, service_config in services.items():
+            is_running, pid = self._probe_service(service_name, service_config)
             
             configured_services[service_name] = {
                 'name': service_name,
                 'status': 'running' if is_running else 'stopped',
                 'pid': pid,
-                'port': services[service_name].get('port'),
-                'description': services[service_name].get('description', ''),
+                'port': service_config.get('port'),
+                'description': service_config.get('description', ''),
                 'uptime': self._get_service_uptime(service_name) if is_running else None,
                 'managed_by': 'cbhands'
             }
@@ -528,11 +683,17 @@ class ServiceManager:
                     'parent_pid': proc.parent_pid
                 }
         
+        # Count running and stopped services in a single pass
+        status_counts = {'running': 0, 'stopped': 0}
+        for service_info in configured_services.values():
+            if service_info['status'] in status_counts:
+                status_counts[service_info['status']] += 1
+        
         return {
             'timestamp': time.time(),
             'total_services': len(configured_services),
-            'running_services': len([s for s in configured_services.values() if s['status'] == 'running']),
-            'stopped_services': len([s for s in configured_services.values() if s['status'] == 'stopped']),
+            'running_services': status_counts['running'],
+            'stopped_services': status_counts['stopped'],
             'services': configured_services
         }
     
@@ -587,9 +748,8 @@ class ServiceManager:
             create_time = proc.create_time()
             uptime_seconds = time.time() - create_time
             
-            hours = int(uptime_seconds // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            seconds = int(uptime_seconds % 60)
+            hours, rem = divmod(int(uptime_seconds), 3600)
+            minutes, seconds = divmod(rem, 60)
             
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         
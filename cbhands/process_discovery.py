@@ -4,12 +4,12 @@ import os
 import time
 import psutil
 import subprocess
-import yaml
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
 
+from .config import yaml_dumper, yaml_loader
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +18,12 @@ logger = get_logger(__name__)
 @dataclass
 class DiscoveredProcess:
     """Represents a discovered process."""
+    # Explicit slots (no per-instance __dict__); dataclass(slots=True) needs 3.10+
+    __slots__ = (
+        'pid', 'name', 'command', 'working_directory', 'port', 'service_type',
+        'parent_pid', 'children', 'cpu_percent', 'memory_percent', 'create_time', 'uptime',
+    )
+    
     pid: int
     name: str
     command: str
@@ -71,6 +77,12 @@ class ProcessDiscovery:
                 'process_name_patterns': ['serve', 'node']
             }
         }
+        
+        # Lowercased command patterns per service type, computed once
+        self._command_patterns_lower = {
+            service_type: tuple(pattern.lower() for pattern in patterns['command_patterns'])
+            for service_type, patterns in self.service_patterns.items()
+        }
     
     def discover_all_processes(self) -> Dict[str, DiscoveredProcess]:
         """Discover all Battle Hands processes.
@@ -89,11 +101,12 @@ class ProcessDiscovery:
                         continue
                     
                     command = ' '.join(proc_info['cmdline'])
+                    command_lower = command.lower()
                     working_dir = proc_info['cwd'] or ''
                     
                     # Check each service type
                     for service_type, patterns in self.service_patterns.items():
-                        if self._matches_patterns(command, working_dir, patterns):
+                        if self._matches_patterns(command_lower, working_dir, service_type, patterns):
                             port = self._find_listening_port(proc_info['pid'])
                             
                             discovered_process = DiscoveredProcess(
@@ -125,11 +138,19 @@ class ProcessDiscovery:
         
         return discovered
     
-    def _matches_patterns(self, command: str, working_dir: str, patterns: Dict[str, List[str]]) -> bool:
-        """Check if process matches service patterns."""
-        # Check command patterns
-        for pattern in patterns['command_patterns']:
-            if pattern.lower() in command.lower():
+    def _matches_patterns(self, command_lower: str, working_dir: str, service_type: str,
+                          patterns: Dict[str, List[str]]) -> bool:
+        """Check if process matches service patterns.
+        
+        Args:
+            command_lower: Lowercased process command line
+            working_dir: Process working directory
+            service_type: Service type the patterns belong to
+            patterns: Service patterns
+        """
+        # Check command patterns (case-insensitive)
+        for pattern in self._command_patterns_lower[service_type]:
+            if pattern in command_lower:
                 return True
         
         # Check working directory patterns
@@ -170,9 +191,8 @@ class ProcessDiscovery:
         """Calculate process uptime."""
         try:
             uptime_seconds = time.time() - create_time
-            hours = int(uptime_seconds // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            seconds = int(uptime_seconds % 60)
+            hours, rem = divmod(int(uptime_seconds), 3600)
+            minutes, seconds = divmod(rem, 60)
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         except:
             return "00:00:00"
@@ -201,8 +221,9 @@ class ProcessDiscovery:
                     'uptime': proc.uptime
                 }
             
+            import yaml
             with open(self.discovered_file, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False)
+                yaml.dump(data, f, Dumper=yaml_dumper(), default_flow_style=False)
                 
         except Exception as e:
             logger.error(f"Error saving discovered processes: {e}")
@@ -212,9 +233,10 @@ class ProcessDiscovery:
         if not os.path.exists(self.discovered_file):
             return {}
         
+        import yaml
         try:
             with open(self.discovered_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=yaml_loader())
             
             processes = {}
             for service_type, proc_data in data.get('processes', {}).items():
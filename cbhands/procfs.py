@@ -0,0 +1,154 @@
+"""Direct /proc readers for cbhands (Linux)."""
+
+import os
+from typing import Iterable, Iterator, Optional, Set, Tuple
+
+# TCP socket tables and the LISTEN state code used in them
+_TCP_TABLES = ('/proc/net/tcp', '/proc/net/tcp6')
+_TCP_LISTEN = b'0A'
+
+
+def pid_alive(pid: int) -> bool:
+    """Check if a process exists, using a null signal.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        True if the process exists
+    """
+    if pid <= 0:
+        # 0 and negative values address process groups, not a process
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+
+def read_cmdline(pid: int) -> Optional[bytes]:
+    """Read the raw command line of a process.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Arguments separated by NUL bytes (no trailing NUL), or None if the
+        process is gone or cannot be read
+    """
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return f.read().rstrip(b'\0')
+    except OSError:
+        return None
+
+
+def iter_cmdlines() -> Iterator[Tuple[int, bytes]]:
+    """Iterate over raw command lines of all readable processes.
+
+    Yields:
+        Tuples of (pid, raw command line) for processes with a non-empty
+        command line
+    """
+    try:
+        names = os.listdir('/proc')
+    except OSError:
+        return
+
+    for name in names:
+        if not name.isdigit():
+            continue
+        raw = read_cmdline(int(name))
+        if raw:
+            yield int(name), raw
+
+
+def listening_inodes(port: int) -> Optional[Set[int]]:
+    """Get inodes of sockets listening on a TCP port.
+
+    Args:
+        port: TCP port number
+
+    Returns:
+        Set of socket inodes (empty if nothing listens on the port),
+        or None if the socket tables are not available
+    """
+    inodes = set()
+    have_table = False
+
+    for table in _TCP_TABLES:
+        try:
+            with open(table, 'rb') as f:
+                data = f.read()
+        except OSError:
+            continue
+        have_table = True
+
+        # Columns: sl local_address rem_address st ... uid timeout inode
+        for line in data.splitlines()[1:]:
+            cols = line.split(None, 10)
+            if len(cols) < 10 or cols[3] != _TCP_LISTEN:
+                continue
+            if int(cols[1].rpartition(b':')[2], 16) == port:
+                inodes.add(int(cols[9]))
+
+    return inodes if have_table else None
+
+
+def find_socket_owner(inodes: Iterable[int]) -> Optional[int]:
+    """Find the process holding one of the given socket inodes.
+
+    Only processes whose file descriptors are readable by the current user
+    can be matched.
+
+    Args:
+        inodes: Socket inodes to look for
+
+    Returns:
+        PID of the owning process, or None if not found
+    """
+    targets = {f'socket:[{inode}]' for inode in inodes}
+    if not targets:
+        return None
+
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return None
+
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            fd_dir = f'/proc/{entry.name}/fd'
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue
+            for fd in fds:
+                try:
+                    if os.readlink(f'{fd_dir}/{fd}') in targets:
+                        return int(entry.name)
+                except OSError:
+                    continue
+
+    return None
+
+
+def pid_listening_on_port(port: int) -> Optional[int]:
+    """Get PID of the process listening on a TCP port.
+
+    Args:
+        port: TCP port number
+
+    Returns:
+        PID of the listening process, or None if not found
+    """
+    inodes = listening_inodes(port)
+    if not inodes:
+        return None
+    return find_socket_owner(inodes)
@@ -0,0 +1,89 @@
+"""Native log following for cbhands (``tail -f`` replacement)."""
+
+import os
+import sys
+import time
+from typing import BinaryIO, Optional
+
+
+def read_last_lines(f: BinaryIO, lines: int, block_size: int = 8192) -> bytes:
+    """Read the last lines of an open binary file.
+
+    Args:
+        f: File object opened in binary mode
+        lines: Number of lines to return
+        block_size: Size of blocks read backwards from the end
+
+    Returns:
+        Raw bytes of the last lines; the file is left positioned at its end
+    """
+    end = f.seek(0, os.SEEK_END)
+    if lines <= 0 or end == 0:
+        return b''
+
+    pos = end
+    data = b''
+    # One extra newline is needed when the file ends with a newline
+    while pos > 0 and data.count(b'\n') <= lines:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        data = f.read(step) + data
+
+    f.seek(end)
+    return b''.join(data.splitlines(keepends=True)[-lines:])
+
+
+def follow(path: str, lines: int = 10, interval: float = 0.1,
+           output: Optional[BinaryIO] = None) -> None:
+    """Follow a file like ``tail -f``.
+
+    Prints the last lines of the file, then keeps writing appended data until
+    interrupted. Truncation and rotation (a new file at the same path) are
+    detected and the file is re-read from the start.
+
+    Args:
+        path: Path to file to follow
+        lines: Number of existing lines to print first
+        interval: Polling interval in seconds when no new data is available
+        output: Binary stream to write to, defaults to stdout
+    """
+    out = output if output is not None else sys.stdout.buffer
+    f = open(path, 'rb')
+    try:
+        out.write(read_last_lines(f, lines))
+        out.flush()
+
+        while True:
+            data = f.read()
+            if data:
+                out.write(data)
+                out.flush()
+                continue
+
+            time.sleep(interval)
+
+            # Check for rotation or truncation only while idle
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+
+            if st.st_ino != os.fstat(f.fileno()).st_ino:
+                try:
+                    new_f = open(path, 'rb')
+                except OSError:
+                    # Rotated away again before we could open it
+                    continue
+
+                # Drain whatever was appended to the old file before rotation
+                data = f.read()
+                if data:
+                    out.write(data)
+                    out.flush()
+                f.close()
+                f = new_f
+            elif st.st_size < f.tell():
+                f.seek(0)
+    finally:
+        f.close()
@@ -0,0 +1,103 @@
+"""Tests for cli module."""
+
+import copy
+import os
+import pickle
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'test_config.yaml')
+
+PLUGIN_COMMANDS = ('create-tables', 'list-tables', 'show-table',
+                   'delete-tables', 'show-redis', 'interactive')
+
+
+@pytest.fixture(scope='module')
+def cli_module():
+    """Import cbhands.cli without running the CLI.
+    
+    The module runs main() when imported, so invoking the root group is
+    stubbed out for the duration of the import.
+    """
+    with patch.object(click.Command, '__call__'):
+        from cbhands import cli
+    return cli
+
+
+@pytest.fixture
+def stub_plugin():
+    """Create a plugin stub whose handlers are mocks."""
+    plugin = MagicMock()
+    plugin.get_commands.return_value = {name: MagicMock() for name in PLUGIN_COMMANDS}
+    return plugin
+
+
+@pytest.fixture
+def invoke(cli_module, stub_plugin):
+    """Invoke the root CLI with the stub plugin as the dev-showroom group."""
+    group = cli_module._create_plugin_group('dev_showroom', stub_plugin)
+    root = cli_module.cli
+    
+    def run(*args):
+        with patch.dict(root.commands), \
+             patch.dict(root.lazy_commands, {'dev-showroom': lambda: group}):
+            return CliRunner().invoke(root, ['-c', CONFIG_PATH, *args])
+    
+    return run
+
+
+def test_plugin_group_lists_commands(invoke):
+    """Test that plugin subcommands are listed before being built."""
+    result = invoke('dev-showroom', '--help')
+    
+    assert result.exit_code == 0
+    for name in PLUGIN_COMMANDS:
+        assert name in result.output
+
+
+def test_delete_tables_all_flag(invoke, stub_plugin):
+    """Test that --all reaches the handler as all_tables."""
+    result = invoke('dev-showroom', 'delete-tables', '--all')
+    
+    assert result.exit_code == 0, result.output
+    stub_plugin.get_commands.return_value['delete-tables'].assert_called_once_with(
+        verbose=False, all_tables=True, name=None)
+
+
+def test_show_table_requires_name(invoke, stub_plugin):
+    """Test that show-table requires --name."""
+    result = invoke('dev-showroom', 'show-table')
+    
+    assert result.exit_code == 2
+    assert '--name' in result.output
+    stub_plugin.get_commands.return_value['show-table'].assert_not_called()
+
+
+def test_verbose_reaches_handler(invoke, stub_plugin):
+    """Test that the root -v flag is passed to plugin handlers."""
+    result = invoke('-v', 'dev-showroom', 'create-tables', '--count', '3')
+    
+    assert result.exit_code == 0, result.output
+    stub_plugin.get_commands.return_value['create-tables'].assert_called_once_with(
+        verbose=True, count=3, mode='fun')
+
+
+def test_plugin_without_supported_commands(cli_module):
+    """Test that a plugin without supported commands gets no group."""
+    plugin = MagicMock()
+    plugin.get_commands.return_value = {'unknown-cmd': MagicMock()}
+    
+    assert cli_module._create_plugin_group('dev_showroom', plugin) is None
+
+
+def test_plugin_metadata_copy_and_pickle(cli_module):
+    """Test that slotted frozen plugin metadata can be copied and pickled."""
+    metadata = cli_module.PluginMetadata('dev_showroom', '0.2.0', 'Showroom')
+    
+    assert copy.copy(metadata) == metadata
+    assert copy.deepcopy(metadata) == metadata
+    assert pickle.loads(pickle.dumps(metadata)) == metadata
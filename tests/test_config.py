@@ -3,6 +3,8 @@
 import os
 import tempfile
 import pytest
+import yaml
+from unittest.mock import patch
 from pathlib import Path
 
 from cbhands.config import Config
@@ -73,3 +75,54 @@ def test_config_invalid_yaml():
             Config(config_path)
     finally:
         os.unlink(config_path)
+
+
+def test_empty_config():
+    """Test that an empty configuration file loads with no sections."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        config_path = f.name
+    
+    try:
+        config = Config(config_path)
+        assert config.get_services() == {}
+        assert config.get_settings() == {}
+        assert config.get_timeout() == 30
+        
+        config.reload()
+        assert config.get_services() == {}
+    finally:
+        os.unlink(config_path)
+
+
+def test_config_cache():
+    """Test that unchanged configuration files are parsed once."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        f.write('settings:\n  timeout: 30\n')
+        config_path = f.name
+    
+    try:
+        with patch('yaml.load', wraps=yaml.load) as mock_load:
+            first = Config(config_path)
+            second = Config(config_path)
+        assert mock_load.call_count == 1
+        assert second.get_timeout() == 30
+        
+        # Instances do not share the cached mapping
+        first.get_settings()['timeout'] = 45
+        assert second.get_timeout() == 30
+        assert Config(config_path).get_timeout() == 30
+        first.get_settings()['timeout'] = 30
+        
+        # Changing the file invalidates the cached parse
+        with open(config_path, 'w') as f:
+            f.write('settings:\n  timeout: 60\n')
+        os.utime(config_path, ns=(0, 0))
+        
+        third = Config(config_path)
+        assert third.get_timeout() == 60
+        assert first.get_timeout() == 30
+        
+        first.reload()
+        assert first.get_timeout() == 60
+    finally:
+        os.unlink(config_path)
@@ -0,0 +1,28 @@
+"""Tests for logger module."""
+
+import logging
+import threading
+
+from cbhands.logger import get_logger
+
+
+def test_get_logger_adds_single_handler():
+    """Test that repeated calls do not add duplicate handlers."""
+    logger = get_logger('cbhands.test.single')
+    
+    assert get_logger('cbhands.test.single') is logger
+    assert len(logger.handlers) == 1
+    assert logger.level == logging.INFO
+
+
+def test_get_logger_concurrent():
+    """Test that concurrent first calls configure the logger once."""
+    name = 'cbhands.test.concurrent'
+    threads = [threading.Thread(target=get_logger, args=(name,)) for _ in range(8)]
+    
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(logging.getLogger(name).handlers) == 1
@@ -1,5 +1,6 @@
 """Tests for manager module."""
 
+import datetime
 import os
 import tempfile
 import time
@@ -206,3 +207,138 @@ def test_get_service_logs_nonexistent(manager):
     """Test getting logs for service without log file."""
     logs = manager.get_service_logs('nonexistent')
     assert 'No log file found' in logs
+
+
+def test_wait_for_service_ready(manager):
+    """Test waiting for a service that accepts connections."""
+    with patch.object(manager, '_is_port_in_use', side_effect=[False, False, True]) as mock_port:
+        assert manager.wait_for_service('test_service', timeout=5, interval=0) is True
+    
+    assert mock_port.call_count == 3
+    mock_port.assert_called_with(8080)
+
+
+def test_wait_for_service_timeout(manager):
+    """Test waiting for a service that never becomes ready."""
+    with patch.object(manager, '_is_port_in_use', return_value=False):
+        started = time.monotonic()
+        assert manager.wait_for_service('test_service', timeout=0.1, interval=0.01) is False
+        assert time.monotonic() - started < 1
+    
+    assert manager.wait_for_service('nonexistent', timeout=0.1) is False
+
+
+def test_get_comprehensive_status(manager):
+    """Test comprehensive status counts."""
+    with patch.object(manager, 'discover_all_processes', return_value={}):
+        status = manager.get_comprehensive_status()
+    
+    assert status['total_services'] == 1
+    assert status['running_services'] == 0
+    assert status['stopped_services'] == 1
+    assert status['services']['test_service']['managed_by'] == 'cbhands'
+
+
+def test_batch_state_saves_once(manager):
+    """Test that state writes inside a batch are flushed once."""
+    with patch('cbhands.manager._dumps_state', return_value=b'{}') as mock_dump:
+        with manager._batch_state():
+            manager._save_state()
+            manager._save_state()
+            assert mock_dump.call_count == 0
+        
+        assert mock_dump.call_count == 1
+
+
+def test_probe_service_cached(manager):
+    """Test that a status sweep probes each service once."""
+    with patch.object(manager, '_check_service_running', return_value=(False, None)) as mock_check:
+        manager.get_service_status('test_service')
+        manager.get_service_status('test_service')
+        assert mock_check.call_count == 1
+        
+        manager.get_all_services_status()
+        assert mock_check.call_count == 2
+
+
+def test_state_roundtrip(manager):
+    """Test saving state as JSON and loading legacy YAML state."""
+    manager.state = {'test_service': {'pid': 12345, 'status': 'running'}}
+    manager._save_state()
+    assert manager._load_state() == manager.state
+    
+    with open(manager.state_file, 'w', encoding='utf-8') as f:
+        f.write('test_service:\n  pid: 54321\n  status: stopped\n')
+    assert manager._load_state() == {'test_service': {'pid': 54321, 'status': 'stopped'}}
+
+
+def test_save_state_failure_keeps_previous(manager):
+    """Test that a failed save leaves the previous state file intact."""
+    manager.state = {'test_service': {'pid': 12345}}
+    manager._save_state()
+    
+    manager.state = {'test_service': {'pid': 54321}}
+    with patch('cbhands.manager._dumps_state', side_effect=TypeError('boom')):
+        manager._save_state()
+    
+    assert manager._load_state() == {'test_service': {'pid': 12345}}
+    assert not os.path.exists(f"{manager.state_file}.tmp.{os.getpid()}")
+
+
+def test_probe_service_reads_pid_file_once(manager):
+    """Test that a verified PID file is not looked up again."""
+    pid_file = manager._get_pid_file('test_service')
+    os.makedirs(os.path.dirname(pid_file), exist_ok=True)
+    with open(pid_file, 'w') as f:
+        f.write(str(os.getpid()))
+    
+    try:
+        with patch.object(manager, '_is_port_in_use', return_value=False), \
+             patch('cbhands.procfs.read_cmdline', return_value=b'sleep\x0010'), \
+             patch.object(manager, '_find_service_pid') as mock_find:
+            assert manager._probe_service('test_service') == (True, os.getpid())
+        
+        mock_find.assert_not_called()
+    finally:
+        os.remove(pid_file)
+
+
+def test_check_child_processes_unknown_owner(manager):
+    """Test that a listener whose owner cannot be found is not ours."""
+    with patch('cbhands.procfs.listening_inodes', return_value={123}), \
+         patch('cbhands.procfs.find_socket_owner', return_value=None):
+        assert manager._check_child_processes('test_service', 8080) is False
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_save_state_non_json_values(manager, use_orjson):
+    """Test that config values and keys without a JSON type are saved as strings."""
+    import cbhands.manager as manager_module
+    
+    if use_orjson and manager_module.orjson is None:
+        pytest.skip("orjson is not installed")
+    
+    manager.state = {'test_service': {'config': {
+        'released': datetime.date(2024, 1, 1),
+        'updated': datetime.datetime(2024, 1, 1, 12, 0),
+        'env': {1: 'x'},
+        'description': 'Сервис',
+    }}}
+    with patch.object(manager_module, 'orjson', manager_module.orjson if use_orjson else None):
+        manager._save_state()
+    
+    with open(manager.state_file, 'rb') as f:
+        data = f.read()
+    assert data.endswith(b'}\n')
+    assert manager._load_state() == {'test_service': {'config': {
+        'released': '2024-01-01',
+        'updated': '2024-01-01 12:00:00',
+        'env': {'1': 'x'},
+        'description': 'Сервис',
+    }}}
+    
+    # Both backends write the same file
+    if manager_module.orjson is not None:
+        with patch.object(manager_module, 'orjson', None):
+            assert manager_module._dumps_state(manager.state) == data
+        assert manager_module._dumps_state(manager.state) == data
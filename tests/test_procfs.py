@@ -0,0 +1,62 @@
+"""Tests for procfs module."""
+
+import os
+import socket
+
+import pytest
+
+from cbhands import procfs
+
+
+pytestmark = pytest.mark.skipif(not os.path.exists('/proc/net/tcp'),
+                                reason="requires /proc/net/tcp")
+
+
+@pytest.fixture
+def listener():
+    """Open a listening socket on a free local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        s.listen()
+        yield s
+
+
+def test_listening_inodes(listener):
+    """Test finding the inode of a listening socket."""
+    port = listener.getsockname()[1]
+    inodes = procfs.listening_inodes(port)
+    
+    assert inodes == {os.fstat(listener.fileno()).st_ino}
+
+
+def test_listening_inodes_free_port():
+    """Test that a closed port has no listeners."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    
+    assert procfs.listening_inodes(port) == set()
+    assert procfs.pid_listening_on_port(port) is None
+
+
+def test_pid_listening_on_port(listener):
+    """Test finding the process listening on a port."""
+    port = listener.getsockname()[1]
+    
+    assert procfs.pid_listening_on_port(port) == os.getpid()
+
+
+def test_pid_alive():
+    """Test process liveness checks."""
+    assert procfs.pid_alive(os.getpid()) is True
+    assert procfs.pid_alive(0) is False
+    assert procfs.pid_alive(-1) is False
+
+
+def test_read_cmdline():
+    """Test reading the command line of the current process."""
+    raw = procfs.read_cmdline(os.getpid())
+    
+    assert raw is not None
+    assert not raw.endswith(b'\0')
+    assert os.getpid() in dict(procfs.iter_cmdlines())
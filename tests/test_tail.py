@@ -0,0 +1,93 @@
+"""Tests for tail module."""
+
+import io
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from cbhands.tail import follow, read_last_lines
+
+
+def test_read_last_lines():
+    """Test reading the last lines of a file."""
+    with tempfile.TemporaryFile() as f:
+        f.write(b''.join(b'Line %d\n' % i for i in range(1000)))
+        f.flush()
+        
+        data = read_last_lines(f, 3, block_size=16)
+        assert data == b'Line 997\nLine 998\nLine 999\n'
+        
+        # File is left positioned at its end for following
+        assert f.read() == b''
+
+
+def test_read_last_lines_short_file():
+    """Test reading more lines than the file contains."""
+    with tempfile.TemporaryFile() as f:
+        f.write(b'Line 1\nLine 2')
+        f.flush()
+        
+        assert read_last_lines(f, 10) == b'Line 1\nLine 2'
+        assert read_last_lines(f, 0) == b''
+
+
+def test_read_last_lines_empty_file():
+    """Test reading an empty file."""
+    with tempfile.TemporaryFile() as f:
+        assert read_last_lines(f, 10) == b''
+
+
+def test_follow_rotation(tmp_path):
+    """Test that data written before rotation is not lost."""
+    path = tmp_path / 'service.log'
+    path.write_bytes(b'a\n')
+    output = io.BytesIO()
+    steps = []
+    
+    def fake_sleep(interval):
+        steps.append(interval)
+        if len(steps) == 1:
+            # Append to the old file, then rotate it away
+            with open(path, 'ab') as f:
+                f.write(b'b\n')
+            os.rename(path, tmp_path / 'service.log.1')
+            path.write_bytes(b'c\n')
+        else:
+            raise KeyboardInterrupt
+    
+    with patch('cbhands.tail.time.sleep', side_effect=fake_sleep):
+        with pytest.raises(KeyboardInterrupt):
+            follow(str(path), lines=10, output=output)
+    
+    assert output.getvalue() == b'a\nb\nc\n'
+
+
+def test_follow_rotation_reopen_fails(tmp_path):
+    """Test that a file vanishing during rotation does not end following."""
+    path = tmp_path / 'service.log'
+    path.write_bytes(b'a\n')
+    output = io.BytesIO()
+    steps = []
+    real_open = open
+    
+    def fake_open(file, mode='r', *args, **kwargs):
+        if len(steps) == 1:
+            raise FileNotFoundError(file)
+        return real_open(file, mode, *args, **kwargs)
+    
+    def fake_sleep(interval):
+        steps.append(interval)
+        if len(steps) == 1:
+            os.rename(path, tmp_path / 'service.log.1')
+            path.write_bytes(b'c\n')
+        elif len(steps) == 3:
+            raise KeyboardInterrupt
+    
+    with patch('cbhands.tail.time.sleep', side_effect=fake_sleep), \
+         patch('builtins.open', side_effect=fake_open):
+        with pytest.raises(KeyboardInterrupt):
+            follow(str(path), lines=10, output=output)
+    
+    assert output.getvalue() == b'a\nc\n'